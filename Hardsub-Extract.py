@@ -1,60 +1,282 @@
 import gradio as gr
 import os
+import errno
 import shutil
+import cv2
 from videocr import save_subtitles_to_file
+import videocr.video
+from paddleocr import PaddleOCR
 import requests
+try:
+    import httpx
+except ImportError:
+    httpx = None
 import urllib.parse
+import time
+import uuid
+import queue
+import subprocess
+import multiprocessing
+import functools
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from tqdm import tqdm
 
 # Define paths
 DEMO_VIDEO_PATH = "demo.mp4"
 DATA_DIR = 'data'  # Modified to relative path 'data'
 TEMP_DIR = 'temp_gradio_files' # Modified to relative path 'temp_gradio_files'
-DOWNLOAD_VIDEO_PATH = os.path.join(DATA_DIR, 'video.mp4')
+PREDECODE_CACHE_DIR = os.path.join(TEMP_DIR, 'predecoded')  # Cropped, decimated videos reused across runs
+PREDECODE_CACHE_LIMIT = 10 * 1024 ** 3  # Bytes of cached videos kept, least recently used are evicted first
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024  # Bytes hashed from each end of a video for cache keys
+DOWNLOAD_VIDEO_PATH = os.path.join(DATA_DIR, 'video.mp4')  # Default for download_video, OCR jobs use their own
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # Initial read size, adapted to measured bandwidth while downloading
+DOWNLOAD_MIN_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_MAX_CHUNK_SIZE = 4 * 1024 * 1024
+DOWNLOAD_READ_INTERVAL = 0.1  # Seconds of data each read should cover at the current bandwidth
+DOWNLOAD_BANDWIDTH_SAMPLES = 8
+DOWNLOAD_WORKERS = 8  # Parallel Range requests used when the server supports them
+PROGRESS_UPDATE_BYTES = 1024 * 1024  # Download progress is reported at most once per MiB...
+PROGRESS_UPDATE_INTERVAL = 0.1  # ...or once per this many seconds, whichever comes first
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Background OCR jobs, so long extractions don't hold Gradio's request handlers
+OCR_JOBS = {}  # job id -> (Future, output path)
+OCR_JOBS_FINISHED = {}  # job id -> time.monotonic() when it finished
+OCR_JOB_RETENTION = 600  # Seconds a finished job waits for its poll before it is dropped
+_ocr_executor = None
+_ocr_executor_lock = threading.Lock()
+_worker_gpu_id = None  # GPU claimed by this process when it is an OCR worker
+
+# Last list_files result, keyed by DATA_DIR's mtime
+_list_files_cache = {'mtime': -1, 'paths': []}
 
 # Ensure directories exist
 os.makedirs(TEMP_DIR, exist_ok=True)
+os.makedirs(PREDECODE_CACHE_DIR, exist_ok=True)
 os.makedirs(DATA_DIR, exist_ok=True)
 
-def download_video(url):
+def open_http_client():
     """
-    Download video from URL and save as video.mp4 with progress bar
+    Return an HTTP/2 httpx client when httpx and h2 are installed, else a requests session.
+    Over HTTP/2 the parallel Range requests share one multiplexed connection.
+    """
+    if httpx is not None:
+        try:
+            return httpx.Client(http2=True, follow_redirects=True, timeout=30.0)
+        except ImportError:
+            # h2 isn't installed
+            pass
+    return requests.Session()
+
+def stream_get(client, url, headers=None):
+    """
+    Start a streaming GET request with an httpx client or a requests session
+    """
+    if httpx is not None and isinstance(client, httpx.Client):
+        return client.send(client.build_request('GET', url, headers=headers), stream=True)
+    return client.get(url, headers=headers, stream=True)
+
+def response_reader(response):
+    """
+    Return a read(size) function over the decoded body of a streaming response
+    """
+    if isinstance(response, requests.Response):
+        response.raw.decode_content = True
+        return response.raw.read
+
+    # httpx only iterates its body, so buffer it up to the requested size
+    chunks = response.iter_bytes()
+    buffer = bytearray()
+
+    def read(size):
+        while len(buffer) < size:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            buffer.extend(chunk)
+        data = bytes(buffer[:size])
+        del buffer[:size]
+        return data
+
+    return read
+
+def iter_adaptive_chunks(response):
+    """
+    Yield the response body in chunks sized from the harmonic mean of recent throughput
+    """
+    read = response_reader(response)
+    samples = deque(maxlen=DOWNLOAD_BANDWIDTH_SAMPLES)
+    chunk_size = DOWNLOAD_CHUNK_SIZE
+
+    while True:
+        started = time.perf_counter()
+        data = read(chunk_size)
+        if not data:
+            break
+        elapsed = time.perf_counter() - started
+        yield data
+
+        if elapsed > 0:
+            samples.append(len(data) / elapsed)
+            bandwidth = len(samples) / sum(1 / sample for sample in samples)
+            chunk_size = int(max(DOWNLOAD_MIN_CHUNK_SIZE,
+                                 min(DOWNLOAD_MAX_CHUNK_SIZE, bandwidth * DOWNLOAD_READ_INTERVAL)))
+
+def coalesced_progress(progress):
+    """
+    Return update(n) and flush() functions that batch updates to progress
+    """
+    pending = 0
+    last_tick = time.monotonic()
+
+    def update(n):
+        nonlocal pending, last_tick
+        pending += n
+        now = time.monotonic()
+        if pending >= PROGRESS_UPDATE_BYTES or now - last_tick > PROGRESS_UPDATE_INTERVAL:
+            progress.update(pending)
+            pending = 0
+            last_tick = now
+
+    def flush():
+        nonlocal pending
+        if pending:
+            progress.update(pending)
+            pending = 0
+
+    return update, flush
+
+def preallocate(fd, size):
+    """
+    Reserve size bytes for fd up front so the download lands in contiguous extents
+    """
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        # Not supported on this platform or filesystem, just set the size
+        os.ftruncate(fd, size)
+
+def write_range(response, fd, start, end, progress):
+    """
+    Write the body of response into fd from offset start, stopping after byte end
+    """
+    update, flush = coalesced_progress(progress)
+    offset = start
+    try:
+        for data in iter_adaptive_chunks(response):
+            data = data[:end + 1 - offset]
+            os.pwrite(fd, data, offset)
+            offset += len(data)
+            update(len(data))
+            if offset > end:
+                break
+    finally:
+        flush()
+        response.close()
+
+    # The file is preallocated, so a short body would otherwise leave a silent hole
+    if offset != end + 1:
+        raise ValueError(f"Download of bytes {start}-{end} ended early at byte {offset}")
+
+def download_range(client, url, fd, start, end, progress):
+    """
+    Download bytes start..end (inclusive) of url into fd at the same offset
+    """
+    response = stream_get(client, url, headers={'Range': f'bytes={start}-{end}'})
+    response.raise_for_status()
+    if response.status_code != 206:
+        response.close()
+        raise ValueError(f"Server ignored Range request for bytes {start}-{end}")
+    content_range = response.headers.get('content-range', '')
+    if not content_range.startswith(f'bytes {start}-{end}/'):
+        response.close()
+        raise ValueError(f"Server answered Range request for bytes {start}-{end} with '{content_range}'")
+
+    write_range(response, fd, start, end, progress)
+
+def download_parallel(client, response, video_path, file_size, progress):
+    """
+    Download response's body with DOWNLOAD_WORKERS concurrent Range requests into a preallocated file
+    """
+    part_size = -(-file_size // DOWNLOAD_WORKERS)
+    ranges = [(start, min(start + part_size, file_size) - 1)
+              for start in range(0, file_size, part_size)]
+
+    fd = os.open(video_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        preallocate(fd, file_size)
+        with ThreadPoolExecutor(max_workers=len(ranges) - 1 or 1) as executor:
+            futures = [executor.submit(download_range, client, str(response.url), fd, start, end, progress)
+                       for start, end in ranges[1:]]
+            # The initial GET already streams from byte 0, so it serves the first range
+            write_range(response, fd, *ranges[0], progress)
+            for future in futures:
+                future.result()
+    finally:
+        os.close(fd)
+
+def download_stream(response, video_path, file_size, progress):
+    """
+    Download response's body over its single connection
+    """
+    update, flush = coalesced_progress(progress)
+    with open(video_path, 'wb') as f:
+        if file_size > 0:
+            preallocate(f.fileno(), file_size)
+        for data in iter_adaptive_chunks(response):
+            size = f.write(data)
+            update(size)
+        flush()
+        # Drop any preallocated tail the server didn't send
+        f.truncate()
+
+def download_video(url, video_path=DOWNLOAD_VIDEO_PATH):
+    """
+    Download video from URL and save it to video_path with progress bar
     """
     try:
         # Validate URL
         if not url or not urllib.parse.urlparse(url).scheme:
             raise ValueError("Please provide a valid URL")
 
-        # Send a HEAD request first to get the file size
-        response = requests.head(url, allow_redirects=True)
-        file_size = int(response.headers.get('content-length', 0))
-
-        # Download the file with progress bar
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-
-        # Initialize progress bar
-        progress = tqdm(
-            total=file_size,
-            unit='iB',
-            unit_scale=True,
-            unit_divisor=1024,
-            desc=f"Downloading video"
-        )
-
-        # Save the file as video.mp4 with progress updates
-        with open(DOWNLOAD_VIDEO_PATH, 'wb') as f:
-            for data in response.iter_content(chunk_size=1024):
-                size = f.write(data)
-                progress.update(size)
-
-        progress.close()
+        with open_http_client() as client:
+            # Start the download right away, its headers give the file size and Range support
+            response = stream_get(client, url)
+            try:
+                response.raise_for_status()
+                file_size = int(response.headers.get('content-length', 0))
+                accepts_ranges = (response.headers.get('accept-ranges', '').lower() == 'bytes'
+                                  and 'content-encoding' not in response.headers)
+
+                # Initialize progress bar
+                progress = tqdm(
+                    total=file_size or None,
+                    unit='iB',
+                    unit_scale=True,
+                    unit_divisor=1024,
+                    desc=f"Downloading video"
+                )
+
+                # Save the file to video_path, in parallel ranges when the server allows it
+                if accepts_ranges and file_size > 0 and hasattr(os, 'pwrite'):
+                    download_parallel(client, response, video_path, file_size, progress)
+                else:
+                    download_stream(response, video_path, file_size, progress)
+
+                progress.close()
+            finally:
+                response.close()
 
         # Get final file size
-        final_size = os.path.getsize(DOWNLOAD_VIDEO_PATH)
-        download_speed = file_size / progress.format_dict["elapsed"] if progress.format_dict["elapsed"] > 0 else 0
+        final_size = os.path.getsize(video_path)
+        download_speed = final_size / progress.format_dict["elapsed"] if progress.format_dict["elapsed"] > 0 else 0
 
-        return (f"Video successfully downloaded to {DOWNLOAD_VIDEO_PATH}\n"
+        return (f"Video successfully downloaded to {video_path}\n"
                 f"Total size: {format_size(final_size)}\n"
                 f"Average speed: {format_size(download_speed)}/s")
 
@@ -63,47 +285,330 @@ def download_video(url):
 
 def format_size(size):
     """Format size in bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
+    # Each unit is 10 bits wide, so the bit length picks the unit directly
+    idx = min(max(0, (int(size).bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{size / (1 << (idx * 10)):.2f} {SIZE_UNITS[idx]}"
+
+def is_linked(src_path, temp_path):
+    return os.path.exists(temp_path) and os.path.samestat(os.stat(src_path), os.stat(temp_path))
+
+def link_file(src_path, temp_path):
+    """
+    Expose src_path at temp_path via a hardlink, or a symlink across devices. Where neither
+    is allowed (e.g. Windows without symlink rights) fall back to shutil.copyfile, which
+    copies in-kernel via sendfile on Linux and skips copy2's extra metadata syscalls.
+    """
+    if os.path.lexists(temp_path):
+        # Already linked to the same file, nothing to do
+        if is_linked(src_path, temp_path):
+            return
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+    try:
+        os.link(src_path, temp_path)
+    except FileExistsError:
+        # A concurrent refresh linked it first
+        if not is_linked(src_path, temp_path):
+            raise
+    except OSError as e:
+        # Fall back only when this filesystem can't hardlink the file, not when the source is bad
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP, errno.ENOTSUP):
+            raise
+        try:
+            os.symlink(os.path.abspath(src_path), temp_path)
+        except FileExistsError:
+            if not is_linked(src_path, temp_path):
+                shutil.copyfile(src_path, temp_path)
+        except OSError:
+            shutil.copyfile(src_path, temp_path)
 
 def list_files():
     try:
-        files = os.listdir(DATA_DIR)
-        # Filter for .srt files
-        srt_files = [f for f in files if f.endswith('.srt')]
+        # Reuse the previous result while DATA_DIR's entries are unchanged
+        mtime = os.stat(DATA_DIR).st_mtime_ns
+        if mtime == _list_files_cache['mtime']:
+            return list(_list_files_cache['paths'])
+
+        # Filter for .srt files, scandir's entries carry their name, path and type
+        with os.scandir(DATA_DIR) as it:
+            srt_entries = [e for e in it if e.name.endswith('.srt') and e.is_file(follow_symlinks=False)]
 
-        # Copy files to temp directory and return temp paths
+        # Link files into temp directory and return temp paths
         temp_paths = []
-        for srt_file in srt_files:
-            src_path = os.path.join(DATA_DIR, srt_file)
-            temp_path = os.path.join(TEMP_DIR, srt_file)
-            shutil.copy2(src_path, temp_path)
+        for entry in srt_entries:
+            temp_path = os.path.join(TEMP_DIR, entry.name)
+            link_file(entry.path, temp_path)
             temp_paths.append(temp_path)
 
-        return temp_paths
+        _list_files_cache['mtime'] = mtime
+        _list_files_cache['paths'] = temp_paths
+        return list(temp_paths)
     except Exception as e:
         print(f"Error listing files: {str(e)}")
         return []
 
-def run_video_ocr(video_source, video_url, input_video, output_file_name, language_code, use_gpu, start_time, end_time, confidence_threshold, similarity_threshold, frames_to_skip, crop_x, crop_y, crop_width, crop_height):
+def detect_gpus():
+    """Return the ids of the GPUs OCR workers can be pinned to, numbered as CUDA sees them"""
+    visible = os.environ.get('CUDA_VISIBLE_DEVICES')
+    if visible is not None:
+        return list(range(len([d for d in visible.split(',') if d.strip()])))
+    try:
+        result = subprocess.run(['nvidia-smi', '-L'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return list(range(len([line for line in result.stdout.splitlines() if line.startswith('GPU')])))
+
+def init_ocr_worker(gpu_ids):
+    """
+    Claim one GPU for this worker process. Paddle has already initialized CUDA while the
+    worker imported this module, so the id is passed to PaddleOCR and FFmpeg explicitly.
+    """
+    global _worker_gpu_id
+    try:
+        _worker_gpu_id = gpu_ids.get_nowait()
+    except queue.Empty:
+        pass
+
+def get_ocr_executor():
+    """Create the OCR worker pool on first use: one worker per GPU, or one on CPU-only hosts"""
+    global _ocr_executor
+    with _ocr_executor_lock:
+        if _ocr_executor is None:
+            # Spawn rather than fork so workers never inherit CUDA state from this process
+            context = multiprocessing.get_context('spawn')
+            gpus = detect_gpus()
+            gpu_ids = context.Queue()
+            for gpu in gpus:
+                gpu_ids.put(gpu)
+            # A single CPU job already uses every core, so CPU-only hosts get one worker
+            _ocr_executor = ProcessPoolExecutor(
+                max_workers=max(1, len(gpus)),
+                mp_context=context,
+                initializer=init_ocr_worker,
+                initargs=(gpu_ids,)
+            )
+        return _ocr_executor
+
+def submit_ocr_job(job_id, video_url, video_path, output_path, ocr_options, paddle_options):
+    """
+    Queue ocr_job on the worker pool and track it under job_id. A worker that crashed
+    (e.g. a segfault or an OOM kill) breaks the whole pool, so it is replaced once.
+    """
+    global _ocr_executor
+    args = (video_url, video_path, output_path, ocr_options, paddle_options)
+    executor = get_ocr_executor()
+    try:
+        future = executor.submit(ocr_job, *args)
+    except BrokenProcessPool:
+        # Only drop the pool that failed; a concurrent submit may have replaced it already
+        with _ocr_executor_lock:
+            if _ocr_executor is executor:
+                _ocr_executor = None
+        executor.shutdown(wait=False)
+        future = get_ocr_executor().submit(ocr_job, *args)
+
+    def mark_finished(_):
+        OCR_JOBS_FINISHED[job_id] = time.monotonic()
+
+    OCR_JOBS[job_id] = (future, output_path)
+    future.add_done_callback(mark_finished)
+    return future
+
+def prune_ocr_jobs():
+    """
+    Drop finished jobs nobody polled, e.g. from closed tabs or a session that resubmitted
+    """
+    cutoff = time.monotonic() - OCR_JOB_RETENTION
+    for job_id, finished in list(OCR_JOBS_FINISHED.items()):
+        if finished < cutoff:
+            OCR_JOBS.pop(job_id, None)
+            OCR_JOBS_FINISHED.pop(job_id, None)
+
+def predecode_cache_key(video_path, *params):
+    """
+    Key a pre-decoded video by the source file's fingerprint and the decode parameters.
+    The fingerprint hashes the file size plus its first and last 64 KiB, so keying a
+    multi-GB video costs one stat and two small reads.
+    """
+    key = hashlib.blake2b(repr(params).encode(), digest_size=16)
+    size = os.path.getsize(video_path)
+    with open(video_path, 'rb') as f:
+        key.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+        key.update(str(size).encode())
+        f.seek(max(0, size - FINGERPRINT_SAMPLE_SIZE))
+        key.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+    return key.hexdigest()
+
+def evict_predecoded():
+    """
+    Delete the least recently used cached videos until the cache fits PREDECODE_CACHE_LIMIT.
+    Cache hits touch their file's mtime, which is more reliable than atime on relatime mounts.
+    """
+    entries = []
+    with os.scandir(PREDECODE_CACHE_DIR) as it:
+        for entry in it:
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Another job evicted it after the scan
+                continue
+            if entry.is_file():
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= PREDECODE_CACHE_LIMIT:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another job evicted it first
+            pass
+        total -= size
+
+def predecode_video(video_path, ocr_options, gpu_id=None):
+    """
+    Decode the video on the GPU with FFmpeg and keep only the cropped, decimated frames in a
+    small intermediate MP4, so videocr decodes a fraction of the original pixels.
+    video_path may also be a URL, which FFmpeg streams straight into the decoder.
+    Intermediates of local files are cached, so reruns that only change OCR thresholds skip
+    decoding. URL sources aren't cached since the remote file may change, and the caller
+    removes their intermediate once done.
+    Returns the intermediate path and matching OCR options, or None if FFmpeg can't do it.
+    """
+    predecoded_options = {k: v for k, v in ocr_options.items() if not k.startswith('crop_')}
+    predecoded_options.update(frames_to_skip=0, use_fullframe=True)
+
+    predecoded_path = None
+    if os.path.isfile(video_path):
+        crop_region = tuple(int(ocr_options[k]) for k in ('crop_x', 'crop_y', 'crop_width', 'crop_height'))
+        predecoded_path = os.path.join(PREDECODE_CACHE_DIR, predecode_cache_key(
+            video_path, crop_region, int(ocr_options['frames_to_skip']), ocr_options['time_end']
+        ) + '.mp4')
+        try:
+            # Mark it as recently used for eviction
+            os.utime(predecoded_path)
+            return predecoded_path, predecoded_options
+        except FileNotFoundError:
+            # Not cached yet, or another job just evicted it
+            pass
+
+    # Check for FFmpeg first, since probing a URL opens the remote stream
+    if not shutil.which('ffmpeg'):
+        return None
+    capture = cv2.VideoCapture(video_path)
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    capture.release()
+    if not fps:
+        return None
+
+    # Same rule as videocr: the custom region applies only when all four values are set
+    if all(ocr_options[k] for k in ('crop_x', 'crop_y', 'crop_width', 'crop_height')):
+        crop = (f"crop={int(ocr_options['crop_width'])}:{int(ocr_options['crop_height'])}"
+                f":{int(ocr_options['crop_x'])}:{int(ocr_options['crop_y'])}")
+    else:
+        # videocr's default region: the bottom third of the frame
+        crop = "crop=iw:ih-trunc(2*ih/3):0:trunc(2*ih/3)"
+    # NVENC needs even dimensions
+    filters = [crop, "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+    modulo = int(ocr_options['frames_to_skip']) + 1
+    if modulo > 1:
+        filters.append(f"fps={fps / modulo}")
+
+    # Only the end is trimmed, so frame timestamps still match the original video.
+    # Encode to a private name first so concurrent jobs never see a partial file, and
+    # make FFmpeg fail on a truncated input instead of exiting 0 with a short video.
+    partial_path = os.path.join(TEMP_DIR, f"{uuid.uuid4().hex}.mp4")
+    command = ['ffmpeg', '-y', '-v', 'error', '-xerror', '-hwaccel', 'cuda']
+    if gpu_id is not None:
+        command += ['-hwaccel_device', str(gpu_id)]
+    command += ['-i', video_path]
+    if ocr_options['time_end']:
+        command += ['-to', ocr_options['time_end']]
+    command += ['-vf', ','.join(filters), '-an',
+                '-c:v', 'h264_nvenc', '-preset', 'p1', '-rc', 'constqp', '-qp', '18']
+    if gpu_id is not None:
+        # Encode on the decoding GPU too, so frames never cross devices
+        command += ['-gpu', str(gpu_id)]
+    command.append(partial_path)
+
+    if subprocess.run(command, capture_output=True).returncode != 0:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        return None
+
+    if predecoded_path is None:
+        return partial_path, predecoded_options
+
+    os.replace(partial_path, predecoded_path)
+    evict_predecoded()
+    return predecoded_path, predecoded_options
+
+def configure_paddle_ocr(**paddle_options):
+    """
+    Set extra PaddleOCR constructor options for this worker's next job. videocr builds its
+    own PaddleOCR instance, so the options are bound onto the class it looks up.
+    """
+    videocr.video.PaddleOCR = functools.partial(PaddleOCR, **paddle_options)
+
+def ocr_job(video_url, video_path, output_path, ocr_options, paddle_options):
+    """
+    Download the video if needed and extract its subtitles, inside an OCR worker process
+    """
+    if _worker_gpu_id is not None:
+        paddle_options = dict(paddle_options, gpu_id=_worker_gpu_id)
+    configure_paddle_ocr(**paddle_options)
+
+    # Hand videocr a GPU-decoded, pre-cropped copy when possible. FFmpeg reads URLs
+    # directly, so the full video only touches disk if this isn't available.
+    predecoded = None
+    if ocr_options['use_gpu']:
+        predecoded = predecode_video(video_url or video_path, ocr_options, _worker_gpu_id)
+
+    download_path = video_path if video_url and not predecoded else None
+    try:
+        if predecoded:
+            video_path, ocr_options = predecoded
+        elif download_path:
+            download_result = download_video(video_url, download_path)
+            if "Error" in download_result:
+                raise ValueError(download_result)
+
+        save_subtitles_to_file(video_path, output_path, **ocr_options)
+    finally:
+        # The downloaded copy and an uncached URL intermediate are only needed by this job
+        if download_path and os.path.exists(download_path):
+            os.remove(download_path)
+        if predecoded and video_url and os.path.exists(predecoded[0]):
+            os.remove(predecoded[0])
+
+    return f"Subtitle extraction completed! File saved to {output_path}"
+
+def run_video_ocr(video_source, video_url, input_video, output_file_name, language_code, use_gpu, start_time, end_time, confidence_threshold, similarity_threshold, frames_to_skip, crop_x, crop_y, crop_width, crop_height, precision, similar_image_threshold, similar_pixel_threshold):
+    """
+    Validate the inputs and queue an OCR job, returning its status, job id and poll timer
+    """
     try:
         # Ensure the output directory exists
         if not os.path.exists(DATA_DIR):
             os.makedirs(DATA_DIR)
 
+        # Per-job paths, so concurrent jobs never share a download or output file
+        job_id = uuid.uuid4().hex[:8]
+
         # Determine video path based on source
+        download_url = None
         if video_source == "Demo Video":
             video_path = DEMO_VIDEO_PATH
         elif video_source == "URL":
             if not video_url:
                 raise ValueError("Please provide a video URL")
-            # Download the video first
-            download_result = download_video(video_url)
-            if "Error" in download_result:
-                raise ValueError(download_result)
-            video_path = DOWNLOAD_VIDEO_PATH
+            # The worker downloads the video first
+            download_url = video_url
+            video_path = os.path.join(DATA_DIR, f'video_{job_id}.mp4')
         else:  # Upload Video
             if not input_video:
                 raise ValueError("Please upload a video file")
@@ -114,12 +619,10 @@ def run_video_ocr(video_source, video_url, input_video, output_file_name, langua
             output_file_name += '.srt'
 
         # Define full path for the output file
-        output_path = os.path.join(DATA_DIR, output_file_name)
+        output_path = os.path.join(DATA_DIR, f'{job_id}_{output_file_name}')
 
-        # Save the subtitles to file
-        save_subtitles_to_file(
-            video_path,
-            output_path,
+        # Queue the subtitle extraction
+        ocr_options = dict(
             lang=language_code,
             use_gpu=use_gpu,
             time_start=start_time,
@@ -130,12 +633,43 @@ def run_video_ocr(video_source, video_url, input_video, output_file_name, langua
             crop_x=crop_x,
             crop_y=crop_y,
             crop_width=crop_width,
-            crop_height=crop_height
+            crop_height=crop_height,
+            similar_image_threshold=int(similar_image_threshold),
+            similar_pixel_threshold=int(similar_pixel_threshold)
+        )
+        # Paddle Inference only runs reduced precision through TensorRT
+        paddle_options = dict(
+            use_tensorrt=use_gpu and precision != "fp32",
+            precision=precision
         )
+        prune_ocr_jobs()
+        submit_ocr_job(job_id, download_url, video_path, output_path, ocr_options, paddle_options)
+
+        return f"OCR job {job_id} queued", job_id, gr.Timer(active=True)
+    except Exception as e:
+        return f"Error: {str(e)}", None, gr.Timer(active=False)
 
-        return f"Subtitle extraction completed! File saved to {output_path}"
+def poll_ocr_job(job_id):
+    """
+    Report the status of an OCR job, stopping the poll timer once it has finished
+    """
+    job = OCR_JOBS.get(job_id)
+    if job is None:
+        return gr.update(), list_files(), gr.Timer(active=False)
+
+    future, output_path = job
+    if future.running():
+        return f"OCR job {job_id} running...", gr.update(), gr.Timer(active=True)
+    if not future.done():
+        return f"OCR job {job_id} waiting for a free worker...", gr.update(), gr.Timer(active=True)
+
+    OCR_JOBS.pop(job_id, None)
+    OCR_JOBS_FINISHED.pop(job_id, None)
+    try:
+        status = future.result()
     except Exception as e:
-        return f"Error: {str(e)}"
+        status = f"Error: {str(e)}"
+    return status, list_files(), gr.Timer(active=False)
 
 def video_ocr_interface():
     with gr.Blocks() as demo:
@@ -182,6 +716,14 @@ def video_ocr_interface():
             crop_width = gr.Number(label="Crop Width", value=0)
             crop_height = gr.Number(label="Crop Height", value=0)
 
+        with gr.Row():
+            # Frames with fewer changed pixels than this reuse the previous frame's text without OCR
+            similar_image_threshold = gr.Slider(label="Similar Image Threshold (pixels)", minimum=0, maximum=5000, value=100, step=1)
+            similar_pixel_threshold = gr.Slider(label="Similar Pixel Threshold (brightness)", minimum=0, maximum=255, value=25, step=1)
+
+        with gr.Row():
+            precision = gr.Dropdown(label="GPU Precision", choices=["fp32", "fp16"], value="fp32")
+
         submit_btn = gr.Button("Start OCR")
         output_label = gr.Textbox(label="Status", interactive=False)
 
@@ -194,6 +736,10 @@ def video_ocr_interface():
 
         refresh_btn = gr.Button("Refresh File List")
 
+        # Id of this session's OCR job, polled every second while it runs
+        job_id = gr.State(None)
+        job_timer = gr.Timer(1, active=False)
+
         def toggle_visibility(choice):
             return (
                 gr.update(visible=(choice == "URL")),  # video_url visibility
@@ -214,16 +760,27 @@ def video_ocr_interface():
                 video_source, video_url, input_video, output_file_name,
                 language_code, use_gpu, start_time, end_time,
                 confidence_threshold, similarity_threshold,
-                frames_to_skip, crop_x, crop_y, crop_width, crop_height
+                frames_to_skip, crop_x, crop_y, crop_width, crop_height,
+                precision,
+                similar_image_threshold, similar_pixel_threshold
             ],
-            outputs=[output_label]
-        ).success(fn=list_files, outputs=[file_list])
+            outputs=[output_label, job_id, job_timer]
+        )
+
+        # Poll the queued job and refresh the file list when it finishes
+        job_timer.tick(
+            fn=poll_ocr_job,
+            inputs=[job_id],
+            outputs=[output_label, file_list, job_timer]
+        )
 
         # Refresh button behavior
         refresh_btn.click(fn=list_files, inputs=[], outputs=[file_list])
 
     return demo
 
-# Launch the Gradio interface
-demo = video_ocr_interface()
-demo.launch() # Removed allowed_paths
+# Launch the Gradio interface (guarded so spawned OCR workers can import this module)
+if __name__ == "__main__":
+    demo = video_ocr_interface()
+    # OCR runs in worker processes, so handlers are short and can run concurrently
+    demo.queue(default_concurrency_limit=4, max_size=32).launch(max_threads=40) # Removed allowed_paths